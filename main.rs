@@ -59,6 +59,18 @@ fn start(main_loop: &glib::MainLoop) -> Result<(), Box<dyn std::error::Error>> {
         })
         .expect("failed to add bus watch");
 
+    // Quit the loop on Ctrl+C from the main context, so the pipeline still gets set to Null
+    #[cfg(unix)]
+    {
+        const SIGINT: i32 = 2;
+        let main_loop_cloned = main_loop.clone();
+        glib::unix_signal_add_local(SIGINT, move || {
+            println!("Got SIGINT, stopping");
+            main_loop_cloned.quit();
+            glib::ControlFlow::Break
+        });
+    }
+
     main_loop.run();
     pipeline.set_state(gst::State::Null).expect("Failed to set pipeline to `Null`");
     println!("Done");
@@ -1,7 +1,81 @@
+from functools import lru_cache
+
 import gi
 gi.require_version('Gst', '1.0')
 from gi.repository import Gst, GObject, GLib
 
+# H.264 encoders in order of preference, each with its low-latency property set.
+# The converter is the element placed in front of the encoder to feed it raw video,
+# and the caps pin the converter output to the encoder's native colorspace.
+# Properties the installed encoder version lacks are dropped when it is picked.
+H264_ENCODERS = [
+    ('nvh264enc', 'videoconvert', 'video/x-raw,format=NV12',
+     'preset=low-latency-hq rc-mode=cbr gop-size=30 zerolatency=true bframes=0 rc-lookahead=0'),
+    ('vaapih264enc', 'videoconvert', 'video/x-raw,format=NV12',
+     'rate-control=cbr tune=low-power quality-level=7 max-bframes=0'),
+    ('qsvh264enc', 'videoconvert', 'video/x-raw,format=NV12', ''),
+    ('mfh264enc', 'videoconvert', 'video/x-raw,format=NV12', ''),
+    # G2D and the VPU share the frame by dma-buf fd, avoiding a copy to system memory.
+    # Plugins that only advertise plain video/x-raw get these caps without the feature.
+    ('vpuenc_h264', 'imxvideoconvert_g2d', 'video/x-raw(memory:DMABuf),format=NV12',
+     'qp-max=30 qp-min=18'),
+    # Sliced threads split each frame across cores without adding frame-threading latency
+    ('x264enc', 'videoconvert', 'video/x-raw,format=I420',
+     'tune=zerolatency speed-preset=ultrafast bframes=0 b-adapt=false key-int-max=15 '
+     'threads=0 sliced-threads=true'),
+]
+
+@lru_cache(maxsize=None)
+def _pick_h264_encoder():
+    """Return (encoder, converter, caps, properties) for the best available H.264 encoder.
+
+    The registry is only scanned once, later instances reuse the result."""
+    registry = Gst.Registry.get()
+    for encoder, converter, caps, props in H264_ENCODERS:
+        factory = registry.lookup_feature(encoder)
+        converter_factory = registry.lookup_feature(converter)
+        if factory and converter_factory:
+            return (encoder, converter, _negotiable_caps(caps, converter_factory, factory),
+                    _supported_props(factory, props))
+    return None
+
+def _negotiable_caps(caps, converter, encoder):
+    """Return caps if the converter's src and the encoder's sink templates accept them,
+    otherwise the same caps in system memory, leaving dma-buf sharing to the allocation query."""
+    wanted = Gst.Caps.from_string(caps)
+    for factory, direction in ((converter, Gst.PadDirection.SRC), (encoder, Gst.PadDirection.SINK)):
+        templates = [t for t in factory.get_static_pad_templates() if t.direction == direction]
+        if not any(t.get_caps().can_intersect(wanted) for t in templates):
+            plain = wanted.copy()
+            plain.set_features(0, None)
+            return plain.to_string()
+    return caps
+
+def _supported_props(factory, props):
+    """Keep the name=value pairs in props that the factory's element type has a property
+    for, and whose value the property accepts when it is an enum."""
+    factory = factory.load()
+    if not factory:
+        return props
+    pspecs = {pspec.name: pspec for pspec in GObject.list_properties(factory.get_element_type())}
+    kept = []
+    for prop in props.split():
+        name, _, value = prop.partition('=')
+        if name in pspecs and _accepts_value(pspecs[name], value):
+            kept.append(prop)
+    return ' '.join(kept)
+
+def _accepts_value(pspec, value):
+    """Whether a launch-string value names one of an enum property's values, other types pass."""
+    enum_class = getattr(pspec, 'enum_class', None)
+    if enum_class is None:
+        return True
+    return any(value in (v.value_nick, v.value_name, str(int(v)))
+               for v in enum_class.__enum_values__.values())
+
+# A plugin loaded later may bring a better encoder, so pick again next time
+Gst.Registry.get().connect('feature-added', lambda registry, feature: _pick_h264_encoder.cache_clear())
+
 class ScailxWebSink(Gst.Bin):
     GST_PLUGIN_NAME = 'scailxwebsink'
     __gstmetadata__ = ("Scailx Web Sink",
@@ -17,29 +91,63 @@ class ScailxWebSink(Gst.Bin):
                      GObject.ParamFlags.READWRITE # flags
                      )
     }
+    # GObject property name to the attribute holding its value
+    _PROP_ATTRS = {'ts-offset': 'ts_offset'}
 
     def __init__(self):
-        self.ts_offset = 0  # Initialize property value
+        # Construct the Bin before touching any instance state
         Gst.Bin.__init__(self)
+        self.ts_offset = 0  # Initialize property value
 
-        # Create the internal pipeline using parse_launch
-        pipeline_str = "imxvideoconvert_g2d ! vpuenc_h264 qp-max=30 qp-min=18 ! websink"
-        bin = Gst.parse_launch(pipeline_str)
+        # Pick the encoder, preferring hardware over software
+        selection = _pick_h264_encoder()
+        if not selection:
+            Gst.error("No H.264 encoder available")
+            return None
+        encoder, converter, caps, props = selection
 
-        # Get the sink pad of the first element and the source pad of the last element
-        first_element = bin.get_by_name("imxvideoconvert_g2d0")
-        if not first_element:
+        # Create the internal bin from a launch string, the leaky queue holds a single
+        # frame with no time or byte limit, so a stalled encoder costs at most one frame
+        pipeline_str = (f"{converter} ! {caps} ! "
+                        "queue max-size-buffers=1 max-size-bytes=0 max-size-time=0 leaky=downstream silent=true ! "
+                        f"{encoder} {props} ! websink")
+        try:
+            bin = Gst.parse_bin_from_description(pipeline_str, False)
+        except GLib.Error as e:
+            # The tuning properties are optional, the encoder still works on its defaults
+            if not props:
+                raise
+            Gst.warning(f"Encoder {encoder} rejected '{props}' ({e.message}), using its defaults")
+            bin = Gst.parse_bin_from_description(pipeline_str.replace(f"{encoder} {props} !", f"{encoder} !"), False)
+
+        # Elements come sorted from the sink upstream, so the first is websink and
+        # the last is the converter, whatever names parse_launch gave them
+        elements = list(bin.iterate_sorted())
+        if not elements:
             Gst.error("Failed to get first element")
             return None
+        websink, first_element = elements[0], elements[-1]
 
         self.add(bin)
         # Create sink pad
         self.sink_pad = Gst.GhostPad.new('sink', first_element.get_static_pad('sink'))
         self.add_pad(self.sink_pad)
 
+        # Forward ts-offset to the sink that does the rendering
+        self.bind_property('ts-offset', websink, 'ts-offset', GObject.BindingFlags.SYNC_CREATE)
+
+    def do_get_property(self, prop):
+        try:
+            return getattr(self, self._PROP_ATTRS[prop.name])
+        except KeyError:
+            raise AttributeError(f"Unknown property {prop.name}") from None
+
     def do_set_property(self, prop, value):
-        pass
+        try:
+            setattr(self, self._PROP_ATTRS[prop.name], value)
+        except KeyError:
+            raise AttributeError(f"Unknown property {prop.name}") from None
 
-# Register the GObject type
-GObject.type_register(ScailxWebSink)
+# PyGObject registers the GType when the class is defined, the plugin loader
+# registers the element factory from this tuple
 __gstelementfactory__ = (ScailxWebSink.GST_PLUGIN_NAME, Gst.Rank.PRIMARY, ScailxWebSink)
@@ -66,8 +66,14 @@ pc.ontrack = function (event) {
 }
 
 let iceTimout = null
+let offerSent = false
 
 function sendOffer() {
+  // Gathering completion and the quiet-period timer can both fire, only post once
+  if (offerSent) {
+    return
+  }
+  offerSent = true;
   (async () => {
     try {
       console.log('Sending offer...');
@@ -137,8 +143,10 @@ pc.oniceconnectionstatechange = e => {
 
 pc.onicecandidate = event => {
   if (event.candidate === null) {
-    // ICE gathering is complete, we can now send the offer to the server
+    // ICE gathering is complete, send the offer now instead of waiting out the timer
     console.log('ICE gathering complete');
+    clearTimeout(iceTimout)
+    sendOffer()
   } else {
     // fire after 150ms of no new candidates
     if (iceTimout) {
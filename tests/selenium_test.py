@@ -1,17 +1,14 @@
 #!/usr/bin/env python3
 import os, shutil
-import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 import gi
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import cv2
-import numpy as np
 
 # set gstremer plugin path for this dir and parent dir
 plugin_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -25,140 +22,190 @@ os.system("rm -rf ~/.cache/gstreamer-1.0/")
 
 # Set up GStreamer
 gi.require_version('Gst', '1.0')
-from gi.repository import Gst, GLib, GObject
-Gst.init(None)
+from gi.repository import Gst
+if not Gst.is_initialized():
+    Gst.init(None)
 
-# Verify plugin registration
-registry = Gst.Registry.get()
-factory = registry.find_feature("websink", Gst.ElementFactory)
-if not factory:
+# Verify plugin registration, looked up once per session
+_SINK_FACTORY = Gst.Registry.get().find_feature("websink", Gst.ElementFactory)
+if not _SINK_FACTORY:
     print("websink element not found in registry!")
 else:
     print("Found websink element in registry")
 
-# Global variables for pipeline and loop
-pipeline = None
-loop = None
-pipeline_thread = None
-
-def start_pipeline():
-    """Start the GStreamer pipeline with websink."""
-    global pipeline, loop
-    try:
-        # Create the pipeline
-        pipeline_str = '''
-            videotestsrc is-live=true ! video/x-raw,width=640,height=480,framerate=30/1 ! videoconvert ! x264enc tune=zerolatency ! websink is-live=true name=wsink
-        '''
-        print("\nStarting GStreamer pipeline:")
-        print(f"Pipeline string: {pipeline_str}")
-
-        print("Creating pipeline")
-        pipeline = Gst.parse_launch(pipeline_str)
-
-        # Add bus watch
-        bus = pipeline.get_bus()
-        bus.add_signal_watch()
-        bus.connect("message", on_bus_message)
-
-        # Set pipeline to PLAYING
-        print("Setting pipeline to PLAYING state")
-        ret = pipeline.set_state(Gst.State.PLAYING)
-        if ret == Gst.StateChangeReturn.FAILURE:
-            print("Failed to start pipeline")
-            return
-
-        print("Pipeline is playing")
-
-        # Run the main loop
-        loop.run()
-    except Exception as e:
-        print(f"Error in pipeline: {e}")
-        if loop and loop.is_running():
-            loop.quit()
-
-def on_bus_message(bus, message):
-    """Handle GStreamer bus messages."""
-    global loop
-    t = message.type
-    if t == Gst.MessageType.EOS:
-        print("End-of-stream")
-        if loop:
-            loop.quit()
-    elif t == Gst.MessageType.ERROR:
-        err, debug = message.parse_error()
-        print(f"Error: {err.message}")
-        if debug:
-            print(f"Debug info: {debug}")
-        if loop:
-            loop.quit()
-    return True
-
-@pytest.fixture(scope="module")
-def gstreamer_pipeline():
-    """Set up and tear down the GStreamer pipeline."""
-    global loop, pipeline_thread, pipeline
-
-    print("Setting up GStreamer pipeline")
-    loop = GLib.MainLoop()
-
-    # Start the pipeline in a separate thread
-    pipeline_thread = threading.Thread(target=start_pipeline)
-    pipeline_thread.daemon = True
-    pipeline_thread.start()
-
-    # Wait for server to start
-    time.sleep(1.7)
-
-    # Yield control back to the test
-    yield
-
-    # Clean up resources
-    print("Tearing down GStreamer pipeline")
-    if pipeline:
-        print("Setting pipeline to NULL state")
-        pipeline.set_state(Gst.State.NULL)
-    if loop and loop.is_running():
-        print("Quitting GLib main loop")
-        loop.quit()
-    if pipeline_thread and pipeline_thread.is_alive():
-        print("Joining pipeline thread")
-        pipeline_thread.join(timeout=2)
-
-@pytest.fixture
-def chrome_driver():
-    """Set up and tear down the Chrome driver."""
-    # Set up Chrome options
-    chrome_options = ChromeOptions()
-    chrome_options.add_argument("--use-fake-ui-for-media-stream")  # Auto-accept camera/mic permissions
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--no-sandbox")
+# Background worker used to launch the browser while the pipeline warms up
+_executor = ThreadPoolExecutor(max_workers=1)
+
+# Chrome options are built once, every launch reuses them
+_CHROMIUM_PATH = shutil.which("chromium-browser") or shutil.which("chromium")
+_CHROME_LOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'chrome_debug.log')
+_CHROME_OPTS = ChromeOptions()
+for _arg in [
+    "--use-fake-ui-for-media-stream",  # Auto-accept camera/mic permissions
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
     # Enable verbose logging
-    chrome_options.add_argument("--enable-logging")
-    chrome_options.add_argument("--v=1")
+    "--enable-logging",
+    "--v=1",
     # Log to a file
-    import os
-    log_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'chrome_debug.log')
-    chrome_options.add_argument(f"--log-file={log_path}")
+    f"--log-file={_CHROME_LOG_PATH}",
     # Headless mode can be problematic for WebRTC, but we'll try
-    chrome_options.add_argument("--headless=new")  # New headless mode for Chrome
-    chromium_path = shutil.which("chromium-browser") or shutil.which("chromium")
-    chrome_options.binary_location = chromium_path
+    "--headless=new",  # New headless mode for Chrome
+]:
+    _CHROME_OPTS.add_argument(_arg)
+# Without a Chromium on PATH, Selenium Manager finds or fetches a Chrome instead
+if _CHROMIUM_PATH:
+    _CHROME_OPTS.binary_location = _CHROMIUM_PATH
+# WebDriver BiDi lets the browser push console messages as they happen
+_CHROME_OPTS.enable_bidi = True
+
+# Reference screenshot the image comparison tests check against
+REFERENCE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'video_screenshot.png')
+
+# Pipeline used by the browser tests
+PIPELINE_STR = '''
+    videotestsrc is-live=true ! video/x-raw,format=I420,width=640,height=480,framerate=30/1 ! queue max-size-buffers=1 max-size-bytes=0 max-size-time=0 leaky=downstream ! x264enc tune=zerolatency speed-preset=ultrafast bframes=0 key-int-max=15 ! websink is-live=true name=wsink
+'''
+
+class PipelineRunner:
+    """Run a GStreamer pipeline on its own thread, polling its bus directly."""
+
+    # Bus messages the runner cares about, everything else stays in C
+    BUS_MESSAGES = Gst.MessageType.ERROR | Gst.MessageType.EOS | Gst.MessageType.STATE_CHANGED
+
+    def __init__(self, pipeline_str):
+        self.pipeline_str = pipeline_str
+        self.pipeline = None
+        self.ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        # Start the pipeline in a separate thread
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+        # Wait for the pipeline to reach PLAYING, the server is up by then
+        if not self.ready.wait(timeout=5):
+            print("Timed out waiting for pipeline to reach PLAYING")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        print("Tearing down GStreamer pipeline")
+        if self.pipeline:
+            print("Setting pipeline to NULL state")
+            self.pipeline.set_state(Gst.State.NULL)
+        self._stop.set()
+        if self._thread and self._thread.is_alive():
+            print("Joining pipeline thread")
+            self._thread.join(timeout=2)
+
+    def _run(self):
+        """Start the GStreamer pipeline and poll its bus until stopped."""
+        try:
+            print("\nStarting GStreamer pipeline:")
+            print(f"Pipeline string: {self.pipeline_str}")
+
+            print("Creating pipeline")
+            self.pipeline = Gst.parse_launch(self.pipeline_str)
+            bus = self.pipeline.get_bus()
+
+            # Set pipeline to PLAYING
+            print("Setting pipeline to PLAYING state")
+            ret = self.pipeline.set_state(Gst.State.PLAYING)
+            if ret == Gst.StateChangeReturn.FAILURE:
+                print("Failed to start pipeline")
+                return
+
+            print("Pipeline is playing")
+
+            # Poll the bus until EOS, an error or teardown
+            while not self._stop.is_set():
+                message = bus.timed_pop_filtered(500 * Gst.MSECOND, self.BUS_MESSAGES)
+                if message and not self._on_bus_message(message):
+                    break
+        except Exception as e:
+            print(f"Error in pipeline: {e}")
+
+    def _on_bus_message(self, message):
+        """Handle a GStreamer bus message, returns False when the pipeline is done."""
+        t = message.type
+        if t == Gst.MessageType.EOS:
+            print("End-of-stream")
+            return False
+        elif t == Gst.MessageType.ERROR:
+            err, debug = message.parse_error()
+            print(f"Error: {err.message}")
+            if debug:
+                print(f"Debug info: {debug}")
+            return False
+        elif t == Gst.MessageType.STATE_CHANGED:
+            if message.src == self.pipeline:
+                old_state, new_state, pending_state = message.parse_state_changed()
+                if new_state == Gst.State.PLAYING:
+                    self.ready.set()
+        return True
 
+@pytest.fixture(scope="module")
+def gstreamer_pipeline(chrome_launch):
+    """Set up and tear down the GStreamer pipeline, after the browser launch has been kicked off."""
+    assert _SINK_FACTORY, "websink element not found in registry"
+    print("Setting up GStreamer pipeline")
+    with PipelineRunner(PIPELINE_STR) as runner:
+        # Yield control back to the test
+        yield runner
+
+def _launch_chrome(console_logs):
+    """Start a Chrome driver that appends browser console messages to console_logs."""
     # Set up webdriver
     print("Starting Chrome browser")
-    driver = webdriver.Chrome(options=chrome_options)
+    driver = webdriver.Chrome(options=_CHROME_OPTS)
     driver.set_window_size(1024, 768)
 
-    # Yield the driver to the test
-    yield driver
+    # Collect browser console messages as they are pushed
+    try:
+        driver.script.add_console_message_handler(console_logs.append)
+    except Exception as e:
+        print(f"Browser console capture unavailable: {e}")
+    return driver
 
-    # Clean up
+@pytest.fixture(scope="session")
+def chrome_launch():
+    """Launch Chrome in the background so it starts in parallel with the pipeline.
+
+    Yields the future of the driver, shared by all tests and quit at the end of the session."""
+    console_logs = []
+    launch = _executor.submit(_launch_chrome, console_logs)
+
+    yield launch
+
+    # Clean up, a failed launch has nothing to quit
+    if launch.exception() is not None:
+        return
+    print("Browser console logs:")
+    for entry in console_logs:
+        print(f"  [{entry.level}] {entry.text}")
     print("Quitting Chrome browser")
-    driver.quit()
+    launch.result().quit()
 
 @pytest.fixture
+def chrome_driver(chrome_launch):
+    """The shared Chrome driver, only waited for once the pipeline is up."""
+    return chrome_launch.result()
+
+@pytest.fixture
+def _chrome_clean(chrome_driver):
+    """Reset the shared Chrome session before each test."""
+    chrome_driver.delete_all_cookies()
+    chrome_driver.get("about:blank")
+    yield
+
+@pytest.fixture(scope="session")
 def firefox_driver():
     """Set up and tear down the Firefox driver."""
+    from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
     # Set up Firefox options
     firefox_options = FirefoxOptions()
     firefox_options.log.level = "trace"  # Set log level to trace
@@ -175,6 +222,17 @@ def firefox_driver():
     print("Quitting Firefox browser")
     driver.quit()
 
+def wait_for_pc_connected(driver, timeout=10):
+    """Wait until the page's RTCPeerConnection reports connected."""
+    return WebDriverWait(driver, timeout).until(
+        lambda d: d.execute_script("return typeof pc !== 'undefined' && pc.connectionState === 'connected'"))
+
+def wait_for_video_data(driver, video, timeout=10):
+    """Wait until the video element has decoded its current frame."""
+    return WebDriverWait(driver, timeout).until(
+        lambda d: d.execute_script("return arguments[0].readyState >= 2", video))
+
+@pytest.mark.usefixtures("_chrome_clean")
 def test_webrtc_stream(gstreamer_pipeline, chrome_driver):
     """Test that the WebRTC stream is working correctly."""
     try:
@@ -188,10 +246,9 @@ def test_webrtc_stream(gstreamer_pipeline, chrome_driver):
         wait = WebDriverWait(chrome_driver, 20)
         video = wait.until(EC.presence_of_element_located((By.TAG_NAME, "video")))
 
-        # Wait for the video to start playing (this is tricky to detect)
-        # Instead, we'll wait a bit to give it time to connect
+        # Wait for the video to have a frame to show
         print("Waiting for WebRTC connection to establish")
-        time.sleep(1)
+        wait_for_video_data(chrome_driver, video)
 
         # Take a screenshot of just the video element
         print("Taking screenshot of the video element")
@@ -221,151 +278,119 @@ def test_webrtc_stream(gstreamer_pipeline, chrome_driver):
         traceback.print_exc()
         pytest.fail(f"Test failed with error: {e}")
 
-def test_image_comparison(gstreamer_pipeline, chrome_driver):
+@pytest.fixture(scope="session")
+def reference_gray():
+    """Grayscale reference screenshot, decoded once and cached next to the PNG."""
+    import cv2
+    import numpy as np
+
+    # Check if reference image exists
+    assert os.path.exists(REFERENCE_PATH), "Reference image doesn't exist"
+
+    # Decode the PNG only when the cache is missing or older than the image
+    npy_path = REFERENCE_PATH.replace('.png', '_gray.npy')
+    if not os.path.exists(npy_path) or os.path.getmtime(npy_path) < os.path.getmtime(REFERENCE_PATH):
+        reference_img = cv2.imread(REFERENCE_PATH)
+        assert reference_img is not None, "Failed to load reference image"
+        np.save(npy_path, cv2.cvtColor(reference_img, cv2.COLOR_BGR2GRAY))
+    return np.load(npy_path, mmap_mode='r')
+
+def compare_with_reference(driver, reference_gray, browser):
+    """
+    Open the stream in the browser, screenshot it and check it against the
+    reference video_screenshot.png using OpenCV.
+    """
+    import cv2
+
+    # Navigate to the WebRTC page
+    url = "http://localhost:8091"
+    print(f"Navigating to {url} with {browser}")
+    driver.get(url)
+
+    # Wait for the video element to appear
+    print("Waiting for video element")
+    wait = WebDriverWait(driver, 20)
+    video = wait.until(EC.presence_of_element_located((By.TAG_NAME, "video")))
+
+    # Wait for the WebRTC connection to establish and the first frame to arrive
+    print("Waiting for WebRTC connection to establish")
+    wait_for_pc_connected(driver)
+    wait_for_video_data(driver, video)
+
+    # Capture a new screenshot for comparison
+    print("Taking new screenshot for comparison")
+    new_screenshot_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), f'{browser.lower()}_screenshot.png')
+    driver.save_screenshot(new_screenshot_path)
+
+    # Load the new screenshot with OpenCV, the reference comes pre-decoded
+    print("Loading images for comparison")
+    ref_gray = reference_gray
+    new_img = cv2.imread(new_screenshot_path)
+
+    # Make sure the screenshot was loaded
+    assert new_img is not None, "Failed to load new screenshot"
+
+    # Resize if dimensions don't match
+    if ref_gray.shape != new_img.shape[:2]:
+        print("Resizing images to match dimensions")
+        new_img = cv2.resize(new_img, (ref_gray.shape[1], ref_gray.shape[0]))
+
+    # Compare images
+    print("Comparing images")
+    # Convert the screenshot to grayscale for comparison
+    new_gray = cv2.cvtColor(new_img, cv2.COLOR_BGR2GRAY)
+
+    # Calculate image similarity from the mean absolute pixel difference,
+    # both images have the same shape so no correlation map is needed
+    diff = cv2.absdiff(ref_gray, new_gray)
+    similarity = 1.0 - float(cv2.mean(diff)[0]) / 255.0
+
+    # A mean difference is forgiving, a flat gray frame still lands near 0.8,
+    # so the bar is high and the frame must also keep the reference's contrast
+    threshold = 0.95
+    if similarity >= threshold:
+        print(f"{browser} image similarity good: {similarity}")
+    else:
+        print(f"{browser} image similarity not good: {similarity}")
+
+    assert similarity >= threshold, f"Images are not similar enough: similarity {similarity} < threshold {threshold}"
+
+    ref_contrast = float(cv2.meanStdDev(ref_gray)[1][0][0])
+    new_contrast = float(cv2.meanStdDev(new_gray)[1][0][0])
+    print(f"{browser} image contrast: {new_contrast} (reference {ref_contrast})")
+    assert new_contrast >= 0.5 * ref_contrast, f"Screenshot looks blank: contrast {new_contrast} < half of reference {ref_contrast}"
+
+    # Clean up the new screenshot after the test
+    # if os.path.exists(new_screenshot_path):
+    #     os.remove(new_screenshot_path)
+
+@pytest.mark.usefixtures("_chrome_clean")
+def test_image_comparison(gstreamer_pipeline, chrome_driver, reference_gray):
     """
     Test capturing a new screenshot and comparing it with reference video_screenshot.png
     using OpenCV to verify similarity.
     """
     try:
-        # Navigate to the WebRTC page
-        url = "http://localhost:8091"
-        print(f"Navigating to {url}")
-        chrome_driver.get(url)
-
-        # Wait for the video element to appear
-        print("Waiting for video element")
-        wait = WebDriverWait(chrome_driver, 20)
-        video = wait.until(EC.presence_of_element_located((By.TAG_NAME, "video")))
-
-        # Give time for the WebRTC connection to establish
-        print("Waiting for WebRTC connection to establish")
-        time.sleep(3)
-
-        # Capture a new screenshot for comparison
-        print("Taking new screenshot for comparison")
-        new_screenshot_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'chrome_screenshot.png')
-        chrome_driver.save_screenshot(new_screenshot_path)
-
-        # Path to the reference image
-        reference_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'video_screenshot.png')
-
-        # Check if reference image exists
-        assert os.path.exists(reference_path), "Reference image doesn't exist"
-
-        # Load images with OpenCV
-        print("Loading images for comparison")
-        reference_img = cv2.imread(reference_path)
-        new_img = cv2.imread(new_screenshot_path)
-
-        # Make sure both images were loaded
-        assert reference_img is not None, "Failed to load reference image"
-        assert new_img is not None, "Failed to load new screenshot"
-
-        # Resize if dimensions don't match
-        if reference_img.shape != new_img.shape:
-            print("Resizing images to match dimensions")
-            new_img = cv2.resize(new_img, (reference_img.shape[1], reference_img.shape[0]))
-
-        # Compare images
-        print("Comparing images")
-        # Convert images to grayscale for comparison
-        ref_gray = cv2.cvtColor(reference_img, cv2.COLOR_BGR2GRAY)
-        new_gray = cv2.cvtColor(new_img, cv2.COLOR_BGR2GRAY)
-
-        # Calculate image similarity index
-        res = cv2.matchTemplate(new_gray, ref_gray, cv2.TM_CCOEFF_NORMED)
-        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(res)
-
-        threshold = 0.8
-        if max_val >= threshold:
-            print(f"Chrome image similarity good: Max value: {max_val}")
-        else:
-            print(f"Chrome image similarity not good: Max value: {max_val}")
-
-        assert max_val >= threshold, f"Images are not similar enough: max_val {max_val} < threshold {threshold}"
-
-        # Clean up the new screenshot after the test
-        # if os.path.exists(new_screenshot_path):
-        #     os.remove(new_screenshot_path)
-
+        compare_with_reference(chrome_driver, reference_gray, "Chrome")
     except Exception as e:
         print(f"Error in image comparison test: {e}")
         import traceback
         traceback.print_exc()
         pytest.fail(f"Image comparison test failed with error: {e}")
 
-# def test_image_comparison_firefox(gstreamer_pipeline, firefox_driver):
-#     """
-#     Test capturing a new screenshot with Firefox and comparing it with reference video_screenshot.png
-#     using OpenCV to verify similarity.
-#     """
-#     try:
-#         # Navigate to the WebRTC page
-#         url = "http://localhost:8091"
-#         print(f"Navigating to {url} with Firefox")
-#         firefox_driver.get(url)
-
-#         # Wait for the video element to appear
-#         print("Waiting for video element in Firefox")
-#         wait = WebDriverWait(firefox_driver, 20)
-#         video = wait.until(EC.presence_of_element_located((By.TAG_NAME, "video")))
-
-#         # Give time for the WebRTC connection to establish
-#         print("Waiting for WebRTC connection to establish in Firefox")
-#         time.sleep(9)
-
-#         # Capture a new screenshot for comparison
-#         print("Taking new screenshot for comparison with Firefox")
-#         new_screenshot_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'firefox_screenshot.png')
-#         firefox_driver.save_screenshot(new_screenshot_path)
-
-#         # Path to the reference image
-#         reference_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'video_screenshot.png')
-
-#         # Check if reference image exists
-#         assert os.path.exists(reference_path), "Reference image doesn't exist"
-
-#         # Load images with OpenCV
-#         print("Loading images for comparison")
-#         reference_img = cv2.imread(reference_path)
-#         new_img = cv2.imread(new_screenshot_path)
-
-#         # Make sure both images were loaded
-#         assert reference_img is not None, "Failed to load reference image"
-#         assert new_img is not None, "Failed to load new screenshot"
-
-#         # Resize if dimensions don't match
-#         if reference_img.shape != new_img.shape:
-#             print(f"Resizing images to match dimensions (reference: {reference_img.shape}, new: {new_img.shape})")
-#             new_img = cv2.resize(new_img, (reference_img.shape[1], reference_img.shape[0]))
-
-#         # Compare images
-#         print("Comparing images")
-#         # Convert images to grayscale for comparison
-#         ref_gray = cv2.cvtColor(reference_img, cv2.COLOR_BGR2GRAY)
-#         new_gray = cv2.cvtColor(new_img, cv2.COLOR_BGR2GRAY)
-
-#         # Calculate image similarity index
-#         res = cv2.matchTemplate(new_gray, ref_gray, cv2.TM_CCOEFF_NORMED)
-#         min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(res)
-
-#         threshold = 0.8
-#         if max_val >= threshold:
-#             print(f"Firefox image similarity good: Max value: {max_val}")
-#         else:
-#             print(f"Firefox image similarity not good: Max value: {max_val}")
-
-#         assert max_val >= threshold, f"Images are not similar enough: max_val {max_val} < threshold {threshold}"
-
-#         # Clean up the new screenshot after the test
-#         # if os.path.exists(new_screenshot_path):
-#         #     os.remove(new_screenshot_path)
-
-#     except Exception as e:
-#         print(f"Error in Firefox image comparison test: {e}")
-#         import traceback
-#         traceback.print_exc()
-#         pytest.fail(f"Firefox image comparison test failed with error: {e}")
+@pytest.mark.skip(reason="Firefox image comparison is disabled")
+def test_image_comparison_firefox(gstreamer_pipeline, firefox_driver, reference_gray):
+    """
+    Test capturing a new screenshot with Firefox and comparing it with reference video_screenshot.png
+    using OpenCV to verify similarity.
+    """
+    try:
+        compare_with_reference(firefox_driver, reference_gray, "Firefox")
+    except Exception as e:
+        print(f"Error in Firefox image comparison test: {e}")
+        import traceback
+        traceback.print_exc()
+        pytest.fail(f"Firefox image comparison test failed with error: {e}")
 
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
\ No newline at end of file
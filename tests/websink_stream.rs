@@ -13,7 +13,7 @@ fn test_websink_sample_h264() {
     gst::log::set_threshold_for_name("websink", gst::DebugLevel::Debug);
 
     println!("🚀 Testing H.264 Sample Mode");
-    gst::Element::register(None, "websink", gst::Rank::NONE, WebSink::static_type()).unwrap();
+    register_websink();
 
     let pls = "videotestsrc is-live=true num-buffers=300 ! video/x-raw,width=640,height=480,framerate=30/1 ! videoconvert ! x264enc tune=zerolatency ! websink port=8087";
     run_pipeline(pls, 8087);
@@ -26,9 +26,9 @@ fn test_websink_rtp_h264() {
     gst::log::set_threshold_for_name("websink", gst::DebugLevel::Debug);
 
     println!("🚀 Testing H.264 RTP Mode");
-    gst::Element::register(None, "websink", gst::Rank::NONE, WebSink::static_type()).unwrap();
+    register_websink();
 
-    let pls = "videotestsrc is-live=true num-buffers=300 ! video/x-raw,width=640,height=480,framerate=30/1 ! videoconvert ! x264enc tune=zerolatency ! rtph264pay ! websink port=8088";
+    let pls = "videotestsrc is-live=true num-buffers=300 ! video/x-raw,width=640,height=480,framerate=30/1 ! videoconvert ! x264enc tune=zerolatency ! rtph264pay config-interval=1 aggregate-mode=zero-latency ! websink port=8088";
     run_pipeline(pls, 8088);
 }
 
@@ -39,9 +39,9 @@ fn test_websink_rtp_vp8() {
     gst::log::set_threshold_for_name("websink", gst::DebugLevel::Debug);
 
     println!("🚀 Testing VP8 RTP Mode");
-    gst::Element::register(None, "websink", gst::Rank::NONE, WebSink::static_type()).unwrap();
+    register_websink();
 
-    let pls = "videotestsrc is-live=true num-buffers=300 ! video/x-raw,width=640,height=480,framerate=30/1 ! videoconvert ! vp8enc deadline=1 ! rtpvp8pay ! websink port=8089";
+    let pls = "videotestsrc is-live=true num-buffers=300 ! video/x-raw,width=640,height=480,framerate=30/1 ! videoconvert ! vp8enc deadline=1 cpu-used=8 end-usage=cbr ! rtpvp8pay ! websink port=8089";
     run_pipeline(pls, 8089);
 }
 
@@ -52,7 +52,7 @@ fn test_websink_rtp_vp9() {
     gst::log::set_threshold_for_name("websink", gst::DebugLevel::Debug);
 
     println!("🚀 Testing VP9 RTP Mode");
-    gst::Element::register(None, "websink", gst::Rank::NONE, WebSink::static_type()).unwrap();
+    register_websink();
 
     let pls = "videotestsrc is-live=true num-buffers=300 ! video/x-raw,width=640,height=480,framerate=30/1 ! videoconvert ! vp9enc deadline=1 ! rtpvp9pay ! websink port=8090";
     run_pipeline(pls, 8090);
@@ -65,9 +65,9 @@ fn test_websink_sample_vp8() {
     gst::log::set_threshold_for_name("websink", gst::DebugLevel::Debug);
 
     println!("🚀 Testing VP8 Sample Mode");
-    gst::Element::register(None, "websink", gst::Rank::NONE, WebSink::static_type()).unwrap();
+    register_websink();
 
-    let pls = "videotestsrc is-live=true num-buffers=300 ! video/x-raw,width=640,height=480,framerate=30/1 ! videoconvert ! vp8enc deadline=1 ! websink port=8091";
+    let pls = "videotestsrc is-live=true num-buffers=300 ! video/x-raw,width=640,height=480,framerate=30/1 ! videoconvert ! vp8enc deadline=1 cpu-used=8 end-usage=cbr ! websink port=8091";
     run_pipeline(pls, 8091);
 }
 
@@ -78,12 +78,19 @@ fn test_websink_sample_vp9() {
     gst::log::set_threshold_for_name("websink", gst::DebugLevel::Debug);
 
     println!("🚀 Testing VP9 Sample Mode");
-    gst::Element::register(None, "websink", gst::Rank::NONE, WebSink::static_type()).unwrap();
+    register_websink();
 
     let pls = "videotestsrc is-live=true num-buffers=300 ! video/x-raw,width=640,height=480,framerate=30/1 ! videoconvert ! vp9enc deadline=1 ! websink port=8092";
     run_pipeline(pls, 8092);
 }
 
+// Register the element once, all tests in this binary share the registry
+fn register_websink() {
+    if gst::ElementFactory::find("websink").is_none() {
+        gst::Element::register(None, "websink", gst::Rank::NONE, WebSink::static_type()).unwrap();
+    }
+}
+
 fn run_pipeline(pls: &str, port: u16) {
     let pipeline = gst::parse::launch(pls).unwrap();
     let pipeline = pipeline.downcast::<gst::Pipeline>().unwrap();
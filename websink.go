@@ -27,11 +27,12 @@ import (
 	"embed"
 	"encoding/json"
 	"fmt"
-	"io"
 	"io/fs"
+	"mime"
 	"net"
 	"net/http"
 	"os"
+	"path"
 	"strconv"
 	"sync"
 	"sync/atomic"
@@ -40,6 +41,7 @@ import (
 	"github.com/go-gst/go-glib/glib"
 	"github.com/go-gst/go-gst/gst"
 	"github.com/go-gst/go-gst/gst/base"
+	"github.com/pion/interceptor"
 	"github.com/pion/webrtc/v4"
 	"github.com/pion/webrtc/v4/pkg/media"
 )
@@ -66,13 +68,13 @@ var CAT = gst.NewDebugCategory(
 
 // SessionRequest represents the JSON structure for session requests
 type SessionRequest struct {
-	Offer json.RawMessage `json:"offer"`
+	Offer webrtc.SessionDescription `json:"offer"`
 }
 
 // SessionResponse represents the JSON structure for session responses
 type SessionResponse struct {
-	Answer    json.RawMessage `json:"answer"`
-	SessionId string          `json:"sessionId"`
+	Answer    *webrtc.SessionDescription `json:"answer"`
+	SessionId string                     `json:"sessionId"`
 }
 
 // Here we define a list of ParamSpecs that will make up the properties for our element.
@@ -104,16 +106,25 @@ type state struct {
 	actualPort int
 	// The WebRTC configuration
 	webrtcConfig webrtc.Configuration
+	// The WebRTC API, built once and shared by every peer connection
+	api *webrtc.API
 	// Map to store active peer connections
 	peerConnectionsMutex sync.RWMutex
 	peerConnections      map[string]*webrtc.PeerConnection
 	numPeers             atomic.Int32
+	// Source of unique peer IDs, never reused within a run
+	nextPeerID atomic.Uint64
 	// Channel to notify about peer connection changes
 	unblock chan int32
 	// Shared video track
 	videoTrack *webrtc.TrackLocalStaticSample
+	// Number of Render calls, used to rate-limit per-frame logging
+	renderCount atomic.Uint64
 }
 
+// renderLogInterval is how many frames pass between repeated per-frame log lines
+const renderLogInterval = 600
+
 // This is another private struct where we hold the parameter values set on our element.
 type settings struct {
 	port       int
@@ -182,6 +193,15 @@ func findAvailablePort(startPort int) (int, error) {
 	return 0, fmt.Errorf("no available ports found between %d and %d", startPort, maxPort)
 }
 
+// maxPeers is the most viewers served at once, further session requests get 503
+const maxPeers = 256
+
+// maxSessionRequestBytes bounds a session request, roomy for SDP with many media sections
+const maxSessionRequestBytes = 4 << 20
+
+// disconnectGrace is how long a disconnected peer may take to recover before it is closed
+const disconnectGrace = 10 * time.Second
+
 // handleSession creates a handler for the /api/session endpoint
 func (w *WebSink) handleSession(resp http.ResponseWriter, req *http.Request) {
 	if req.Method != http.MethodPost {
@@ -189,22 +209,23 @@ func (w *WebSink) handleSession(resp http.ResponseWriter, req *http.Request) {
 		return
 	}
 
-	// Read the request body
-	body, err := io.ReadAll(req.Body)
-	if err != nil {
-		http.Error(resp, "Error reading request body", http.StatusBadRequest)
+	// Turn viewers away before any WebRTC resources are spent on them
+	if w.state.numPeers.Load() >= maxPeers {
+		http.Error(resp, "Too many viewers, try again later", http.StatusServiceUnavailable)
 		return
 	}
 
-	// Parse the JSON request
+	// Decode the request, offer included, straight from the body before anything needs cleaning up
+	req.Body = http.MaxBytesReader(resp, req.Body, maxSessionRequestBytes)
 	var sessionReq SessionRequest
-	if err := json.Unmarshal(body, &sessionReq); err != nil {
-		http.Error(resp, "Error parsing JSON", http.StatusBadRequest)
+	if err := json.NewDecoder(req.Body).Decode(&sessionReq); err != nil {
+		http.Error(resp, "Error parsing JSON: "+err.Error(), http.StatusBadRequest)
 		return
 	}
+	offer := sessionReq.Offer
 
 	// Generate a unique ID for this peer connection
-	peerID := fmt.Sprintf("peer-%d", len(w.state.peerConnections)+1)
+	peerID := fmt.Sprintf("peer-%d", w.state.nextPeerID.Add(1))
 
 	// Create a new peer connection for this client
 	peerConnection, err := w.createPeerConnection(peerID)
@@ -213,23 +234,17 @@ func (w *WebSink) handleSession(resp http.ResponseWriter, req *http.Request) {
 		return
 	}
 
-	// Add to the peer connections map
-	w.updatePeerConnections(peerID, peerConnection, true)
-
-	// Decode the offer
-	offer := webrtc.SessionDescription{}
-	if err := json.Unmarshal(sessionReq.Offer, &offer); err != nil {
-		http.Error(resp, "Error parsing offer: "+err.Error(), http.StatusBadRequest)
-		// Remove from peer connections map if we fail
-		w.updatePeerConnections(peerID, nil, false)
-		return
-	}
+	// Release the peer connection on every failure path, registering it disarms this
+	registered := false
+	defer func() {
+		if !registered {
+			peerConnection.Close()
+		}
+	}()
 
 	// Set the remote SessionDescription
 	if err := peerConnection.SetRemoteDescription(offer); err != nil {
 		http.Error(resp, "Error setting remote description: "+err.Error(), http.StatusInternalServerError)
-		// Remove from peer connections map if we fail
-		w.updatePeerConnections(peerID, nil, false)
 		return
 	}
 
@@ -237,45 +252,45 @@ func (w *WebSink) handleSession(resp http.ResponseWriter, req *http.Request) {
 	answer, err := peerConnection.CreateAnswer(nil)
 	if err != nil {
 		http.Error(resp, "Error creating answer: "+err.Error(), http.StatusInternalServerError)
-		// Remove from peer connections map if we fail
-		w.updatePeerConnections(peerID, nil, false)
 		return
 	}
 
+	// Create the gathering promise before gathering can start, so its completion is never missed
+	gatherComplete := webrtc.GatheringCompletePromise(peerConnection)
+
 	// Sets the LocalDescription, and starts our UDP listeners
 	if err = peerConnection.SetLocalDescription(answer); err != nil {
 		http.Error(resp, "Error setting local description: "+err.Error(), http.StatusInternalServerError)
-		// Remove from peer connections map if we fail
-		w.updatePeerConnections(peerID, nil, false)
 		return
 	}
 
 	// Wait for ICE gathering to complete
-	gatherComplete := webrtc.GatheringCompletePromise(peerConnection)
 	<-gatherComplete
 
-	// Marshal the answer to JSON
-	answerJSON, err := json.Marshal(peerConnection.LocalDescription())
+	// Encode the response, answer included, up front so it goes out with a Content-Length in a single write
+	body, err := json.Marshal(SessionResponse{
+		Answer:    peerConnection.LocalDescription(),
+		SessionId: peerID,
+	})
 	if err != nil {
-		http.Error(resp, "Error encoding answer: "+err.Error(), http.StatusInternalServerError)
-		// Remove from peer connections map if we fail
-		w.updatePeerConnections(peerID, nil, false)
+		http.Error(resp, "Error encoding response: "+err.Error(), http.StatusInternalServerError)
 		return
 	}
 
+	// Register the peer only once its answer is ready, so failed sessions never show up
+	w.updatePeerConnections(peerID, peerConnection, true)
+	registered = true
+
 	// Return the answer as JSON
 	resp.Header().Set("Content-Type", "application/json")
-	response := SessionResponse{
-		Answer:    answerJSON,
-		SessionId: peerID,
-	}
-	json.NewEncoder(resp).Encode(response)
+	resp.Header().Set("Content-Length", strconv.Itoa(len(body)))
+	resp.Write(body)
 }
 
 // createPeerConnection creates a new peer connection with the shared tracks
 func (w *WebSink) createPeerConnection(peerID string) (*webrtc.PeerConnection, error) {
 	// Create a new RTCPeerConnection
-	peerConnection, err := webrtc.NewPeerConnection(w.state.webrtcConfig)
+	peerConnection, err := w.state.api.NewPeerConnection(w.state.webrtcConfig)
 	if err != nil {
 		return nil, err
 	}
@@ -285,10 +300,17 @@ func (w *WebSink) createPeerConnection(peerID string) (*webrtc.PeerConnection, e
 	peerConnection.OnICEConnectionStateChange(func(connectionState webrtc.ICEConnectionState) {
 		CAT.Log(gst.LevelInfo, fmt.Sprintf("Connection State for %s has changed to %s", peerID, connectionState.String()))
 
-		// Clean up when disconnected
-		if connectionState == webrtc.ICEConnectionStateDisconnected ||
-			connectionState == webrtc.ICEConnectionStateFailed ||
-			connectionState == webrtc.ICEConnectionStateClosed {
+		switch connectionState {
+		case webrtc.ICEConnectionStateDisconnected:
+			// Usually a network or ICE consent blip, give the peer disconnectGrace to recover
+			// before closing it, the Closed state then cleans up
+			time.AfterFunc(disconnectGrace, func() {
+				if peerConnection.ICEConnectionState() == webrtc.ICEConnectionStateDisconnected {
+					CAT.Log(gst.LevelInfo, fmt.Sprintf("Peer %s did not reconnect, closing", peerID))
+					peerConnection.Close()
+				}
+			})
+		case webrtc.ICEConnectionStateFailed, webrtc.ICEConnectionStateClosed:
 			CAT.Log(gst.LevelInfo, fmt.Sprintf("Peer %s disconnected, cleaning up", peerID))
 			// Remove from peer connections map
 			w.updatePeerConnections(peerID, nil, false)
@@ -300,12 +322,66 @@ func (w *WebSink) createPeerConnection(peerID string) (*webrtc.PeerConnection, e
 	// Add the video track to the peer connection
 	_, err = peerConnection.AddTrack(w.state.videoTrack)
 	if err != nil {
+		peerConnection.Close()
 		return nil, err
 	}
 
 	return peerConnection, nil
 }
 
+// staticAsset is an embedded client file held in memory with its response headers
+type staticAsset struct {
+	contentType   string
+	contentLength string
+	body          []byte
+}
+
+// staticAssets maps each request path to its embedded file, read once at startup
+// so a request is a map lookup and a single write
+var staticAssets = func() map[string]*staticAsset {
+	static, _ := fs.Sub(staticFiles, "static")
+	assets := map[string]*staticAsset{}
+	fs.WalkDir(static, ".", func(name string, d fs.DirEntry, err error) error {
+		if err != nil || d.IsDir() {
+			return nil
+		}
+		body, err := fs.ReadFile(static, name)
+		if err != nil {
+			return nil
+		}
+		contentType := mime.TypeByExtension(path.Ext(name))
+		if contentType == "" {
+			contentType = http.DetectContentType(body)
+		}
+		assets["/"+name] = &staticAsset{
+			contentType:   contentType,
+			contentLength: strconv.Itoa(len(body)),
+			body:          body,
+		}
+		return nil
+	})
+	if index, ok := assets["/index.html"]; ok {
+		assets["/"] = index
+	}
+	return assets
+}()
+
+// serveStatic serves the embedded client files
+func serveStatic(resp http.ResponseWriter, req *http.Request) {
+	asset, ok := staticAssets[req.URL.Path]
+	if !ok {
+		http.NotFound(resp, req)
+		return
+	}
+	header := resp.Header()
+	header.Set("Content-Type", asset.contentType)
+	header.Set("Content-Length", asset.contentLength)
+	resp.Write(asset.body)
+}
+
+// readHeaderTimeout drops connections that send no complete request in time, such as port scanners
+const readHeaderTimeout = 5 * time.Second
+
 // startHTTPServer starts the HTTP server for the websink
 func (w *WebSink) startHTTPServer(self *base.GstBaseSink) bool {
 	// Find an available port
@@ -318,18 +394,14 @@ func (w *WebSink) startHTTPServer(self *base.GstBaseSink) bool {
 
 	// Set up HTTP handlers
 	mux := http.NewServeMux()
-	// fileserver := http.FileServer(http.Dir("./static"))
-	static, _ := fs.Sub(staticFiles, "static")
-	fileserver := http.FileServer(http.FS(static))
-
 	mux.HandleFunc("POST /api/session", w.handleSession)
-	mux.Handle("GET /favicon.ico", fileserver)
-	mux.Handle("GET /", fileserver)
+	mux.HandleFunc("GET /", serveStatic)
 
 	// Create the HTTP server
 	w.state.server = &http.Server{
-		Addr:    ":" + strconv.Itoa(port),
-		Handler: mux,
+		Addr:              ":" + strconv.Itoa(port),
+		Handler:           mux,
+		ReadHeaderTimeout: readHeaderTimeout,
 	}
 
 	// Start the HTTP server in a goroutine
@@ -487,6 +559,20 @@ func (w *WebSink) Start(self *base.GstBaseSink) bool {
 		}
 	}
 
+	// Build the WebRTC API once instead of on every NewPeerConnection call,
+	// each peer connection still gets its own copy of the media engine
+	mediaEngine := &webrtc.MediaEngine{}
+	if err := mediaEngine.RegisterDefaultCodecs(); err != nil {
+		self.Log(CAT, gst.LevelError, "Failed to register codecs")
+		return false
+	}
+	interceptors := &interceptor.Registry{}
+	if err := webrtc.RegisterDefaultInterceptors(mediaEngine, interceptors); err != nil {
+		self.Log(CAT, gst.LevelError, "Failed to register interceptors")
+		return false
+	}
+	w.state.api = webrtc.NewAPI(webrtc.WithMediaEngine(mediaEngine), webrtc.WithInterceptorRegistry(interceptors))
+
 	// Create shared video track
 	var err error
 	w.state.videoTrack, err = webrtc.NewTrackLocalStaticSample(
@@ -544,9 +630,13 @@ func (w *WebSink) Render(self *base.GstBaseSink, buffer *gst.Buffer) gst.FlowRet
 		return gst.FlowError
 	}
 
+	renderCount := w.state.renderCount.Add(1) - 1
+
 	if w.settings.isLive {
 		if w.state.numPeers.Load() == 0 {
-			self.Log(CAT, gst.LevelDebug, "No clients connected")
+			if renderCount%renderLogInterval == 0 {
+				self.Log(CAT, gst.LevelDebug, "No clients connected")
+			}
 			return gst.FlowOK
 		}
 	} else {
@@ -1,6 +1,7 @@
 use gst::glib;
 use gst::prelude::*;
 use gst::subclass::prelude::*;
+use gst_base::prelude::*;
 use gst_base::subclass::prelude::*;
 
 use std::sync::atomic::{AtomicU32, Ordering};
@@ -11,14 +12,13 @@ use std::time::Duration;
 use bytes;
 use tokio::runtime::Runtime;
 use tokio::sync::mpsc;
+use tokio::sync::watch;
 use webrtc::api::media_engine::{MIME_TYPE_H264, MIME_TYPE_HEVC, MIME_TYPE_VP8, MIME_TYPE_VP9};
 use webrtc::ice_transport::ice_server::RTCIceServer;
-use webrtc::media::Sample;
 use webrtc::peer_connection::configuration::RTCConfiguration;
 use webrtc::rtp_transceiver::rtp_codec::RTCRtpCodecCapability;
 use webrtc::track::track_local::track_local_static_sample::TrackLocalStaticSample;
 use webrtc::track::track_local::track_local_static_rtp::TrackLocalStaticRTP;
-use webrtc::track::track_local::TrackLocalWriter;
 
 // Import from our server module
 use crate::websink::server;
@@ -27,6 +27,10 @@ use crate::websink::server;
 pub static CAT: LazyLock<gst::DebugCategory> =
     LazyLock::new(|| gst::DebugCategory::new("websink", gst::DebugColorFlags::empty(), Some("webrtc streaming sink element")));
 
+// Buffers render() may queue ahead of the track writer before it waits, these are
+// whole frames in sample mode and single RTP packets in RTP mode
+const FRAME_QUEUE_DEPTH: usize = 4;
+
 // Video codec enumeration for multi-codec support
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
 pub enum VideoCodec {
@@ -115,12 +119,19 @@ pub struct WebSink {
     settings: Mutex<Settings>,
     state: Arc<Mutex<State>>,
     render_count: AtomicU32,
+    // Set between unlock() and unlock_stop(), wakes a render() waiting on the track writer
+    unlocking: watch::Sender<bool>,
 }
 
 // Default implementation for our element
 impl Default for WebSink {
     fn default() -> Self {
-        Self { settings: Mutex::new(Settings::default()), state: Arc::new(Mutex::new(State::default())), render_count: AtomicU32::new(0) }
+        Self {
+            settings: Mutex::new(Settings::default()),
+            state: Arc::new(Mutex::new(State::default())),
+            render_count: AtomicU32::new(0),
+            unlocking: watch::channel(false).0,
+        }
     }
 }
 
@@ -279,9 +290,10 @@ impl BaseSinkImpl for WebSink {
     fn start(&self) -> Result<(), gst::ErrorMessage> {
         gst::info!(CAT, "🚀 Starting WebSink");
 
-        // Initialize Tokio runtime
+        // Initialize Tokio runtime, the HTTP server and all peer connections share its
+        // workers, one per CPU core, named so they are easy to spot in a thread dump
         gst::debug!(CAT, "⚙️ Initializing Tokio runtime");
-        let runtime = match Runtime::new() {
+        let runtime = match tokio::runtime::Builder::new_multi_thread().thread_name("websink-rt").enable_all().build() {
             Ok(rt) => {
                 gst::info!(CAT, "✅ Tokio runtime created successfully");
                 rt
@@ -296,7 +308,14 @@ impl BaseSinkImpl for WebSink {
         let (tx, rx) = mpsc::channel(1);
         gst::info!(CAT, "📺 Created mpsc channel for live mode signaling");
 
-        gst::info!(CAT, "✅ WebRTC components will be initialized per session");
+        // Build the WebRTC API once, sessions only create peer connections from it
+        let webrtc_api = match server::build_webrtc_api() {
+            Ok(api) => Arc::new(api),
+            Err(err) => {
+                gst::error!(CAT, "❌ Failed to create WebRTC API: {}", err);
+                return Err(gst::error_msg!(gst::ResourceError::Failed, ["Failed to create WebRTC API: {}", err]));
+            }
+        };
 
         // Note: Video track will be created in set_caps when codec is detected
         gst::debug!(CAT, "📋 Video track will be created when codec is detected from caps");
@@ -318,6 +337,7 @@ impl BaseSinkImpl for WebSink {
         state.unblock_tx = Some(tx);
         state.unblock_rx = Some(rx);
         state.webrtc_config = Some(webrtc_config);
+        state.webrtc_api = Some(webrtc_api);
 
         // Start HTTP server
         gst::info!(CAT, "🌐 Starting HTTP server on port {}", port);
@@ -355,28 +375,59 @@ impl BaseSinkImpl for WebSink {
             gst::debug!(CAT, "🌐 No HTTP server handle to abort");
         }
 
-        // Clear peer connections
-        let peer_count = state.peer_connections.len();
-        state.peer_connections.clear();
-        gst::info!(CAT, "👥 Cleared {} peer connections", peer_count);
+        // Close peer connections on the runtime before it goes away. The lock is
+        // released first, as closing runs each connection's state change handler,
+        // which takes it too.
+        let peers: Vec<_> = state.peer_connections.drain().map(|(_, pc)| pc).collect();
+        let runtime = state.runtime.take();
+        drop(state);
+        if let Some(runtime) = &runtime {
+            runtime.block_on(async {
+                for pc in &peers {
+                    if let Err(e) = pc.close().await {
+                        gst::warning!(CAT, "⚠️ Failed to close peer connection: {}", e);
+                    }
+                }
+            });
+        }
+        gst::info!(CAT, "👥 Closed {} peer connections", peers.len());
+        drop(peers);
+        drop(runtime);
 
         // Reset state
+        let mut state = self.state.lock().unwrap();
         state.unblock_tx = None;
         state.unblock_rx = None;
-        state.runtime = None;
         state.video_track = None;
+        state.frame_tx = None;
         state.webrtc_config = None;
+        state.webrtc_api = None;
         gst::debug!(CAT, "🧹 Reset all state components");
 
         gst::info!(CAT, "✅ WebSink stopped successfully");
         Ok(())
     }
 
+    fn unlock(&self) -> Result<(), gst::ErrorMessage> {
+        gst::debug!(CAT, "🔓 Unlocking render");
+        self.unlocking.send_replace(true);
+        Ok(())
+    }
+
+    fn unlock_stop(&self) -> Result<(), gst::ErrorMessage> {
+        gst::debug!(CAT, "🔒 Unlock stopped");
+        self.unlocking.send_replace(false);
+        Ok(())
+    }
+
     fn render(&self, buffer: &gst::Buffer) -> Result<gst::FlowSuccess, gst::FlowError> {
-        let (num_peers, is_live) = {
+        let is_live = self.settings.lock().unwrap().is_live;
+        // Lock the state once per buffer, the sender is cloned out so the lock is not held
+        // while waiting on the writer
+        let (num_peers, frame_tx) = {
             let state_guard = self.state.lock().unwrap();
-            let settings_guard = self.settings.lock().unwrap();
-            (state_guard.peer_connections.len(), settings_guard.is_live)
+            let num_peers = state_guard.peer_connections.len();
+            (num_peers, if num_peers > 0 { state_guard.frame_tx.clone() } else { None })
         };
         let render_count = self.render_count.fetch_add(1, Ordering::Relaxed);
 
@@ -391,53 +442,38 @@ impl BaseSinkImpl for WebSink {
             return Ok(gst::FlowSuccess::Ok);
         }
 
-        let map = buffer.map_readable().map_err(|_| {
-            gst::error!(CAT, "❌ Failed to map buffer");
-            gst::FlowError::Error
-        })?;
-
-        let data = map.as_slice();
-
-        if num_peers > 0 {
-            let state = self.state.lock().unwrap();
-            if let Some(video_track) = &state.video_track {
-                match video_track {
-                    server::VideoTrack::Sample(track) => {
-                        let track_clone = Arc::clone(track);
-                        let data_copy = bytes::Bytes::copy_from_slice(data);
-                        let duration = buffer.duration().unwrap_or_else(|| gst::ClockTime::from_nseconds(33_333_333));
-
-                        if let Some(runtime) = &state.runtime {
-                            runtime.spawn(async move {
-                                let sample = Sample { data: data_copy, duration: Duration::from_nanos(duration.nseconds()), ..Default::default() };
-
-                                if let Err(e) = track_clone.write_sample(&sample).await {
-                                    gst::error!(CAT, "❌ Failed to write sample: {}", e);
-                                }
-                            });
-                        }
+        if let Some(frame_tx) = frame_tx {
+            // The frame keeps a mapped reference to the buffer, so its memory reaches the track without a copy
+            let map = buffer.clone().into_mapped_buffer_readable().map_err(|_| {
+                gst::error!(CAT, "❌ Failed to map buffer");
+                gst::FlowError::Error
+            })?;
+            let duration = buffer.duration().unwrap_or_else(|| gst::ClockTime::from_nseconds(33_333_333));
+            let frame = server::Frame { data: bytes::Bytes::from_owner(map), duration: Duration::from_nanos(duration.nseconds()) };
+
+            // Wait for room in the queue rather than drop encoded data the decoder needs.
+            // unlock() interrupts the wait for a flush or state change, wait_preroll() then
+            // returns the flow to report or lets the buffer through once playing again.
+            let mut unlocking = self.unlocking.subscribe();
+            loop {
+                let permit = futures::executor::block_on(async {
+                    tokio::select! {
+                        biased;
+                        permit = frame_tx.reserve() => Some(permit),
+                        _ = unlocking.wait_for(|unlocking| *unlocking) => None,
+                    }
+                });
+                match permit {
+                    Some(Ok(permit)) => {
+                        permit.send(frame);
+                        break;
                     }
-                    server::VideoTrack::Rtp(track) => {
-                        let track_clone = Arc::clone(track);
-                        let data_copy = data.to_vec();
-
-                        if let Some(runtime) = &state.runtime {
-                            runtime.spawn(async move {
-                                use util::Unmarshal;
-
-                                let mut buf = &data_copy[..];
-                                match rtp::packet::Packet::unmarshal(&mut buf) {
-                                    Ok(rtp_packet) => {
-                                        if let Err(e) = track_clone.write_rtp(&rtp_packet).await {
-                                            gst::error!(CAT, "❌ Failed to write RTP packet: {}", e);
-                                        }
-                                    }
-                                    Err(e) => {
-                                        gst::error!(CAT, "❌ Failed to parse RTP packet: {}", e);
-                                    }
-                                }
-                            });
-                        }
+                    Some(Err(_)) => {
+                        gst::debug!(CAT, "Track writer has stopped, dropping buffer");
+                        break;
+                    }
+                    None => {
+                        self.obj().wait_preroll()?;
                     }
                 }
             }
@@ -475,6 +511,12 @@ impl WebSink {
             }
         };
 
+        // A single writer task keeps frames in order, replacing the sender ends the previous one
+        let (frame_tx, frame_rx) = mpsc::channel(FRAME_QUEUE_DEPTH);
+        if let Some(runtime) = &state.runtime {
+            runtime.spawn(video_track.clone().write_frames(frame_rx));
+        }
+        state.frame_tx = Some(frame_tx);
         state.video_track = Some(video_track);
 
         Ok(())
@@ -1,32 +1,38 @@
 use axum::{
-    extract::State as AxumState,
-    http::StatusCode,
+    extract::{DefaultBodyLimit, State as AxumState},
+    http::{header, HeaderMap, HeaderValue, StatusCode},
     response::{IntoResponse, Response},
     routing::{get, post},
     Json, Router,
 };
+use bytes::Bytes;
+use flate2::{write::GzEncoder, Compression};
 use get_if_addrs::get_if_addrs;
 use hostname::get as get_hostname;
 use rust_embed::RustEmbed;
 use serde::{Deserialize, Serialize};
+use std::borrow::Cow;
 use std::collections::HashMap;
-use std::net::TcpListener;
-use std::sync::{Arc, Mutex};
+use std::io::Write;
+use std::sync::{Arc, LazyLock, Mutex};
+use std::time::Duration;
 use tokio::runtime::Runtime;
 use tokio::sync::mpsc;
+use tower::limit::GlobalConcurrencyLimitLayer;
 use uuid::Uuid;
 
 // WebRTC imports
 use webrtc::api::interceptor_registry::register_default_interceptors;
 use webrtc::api::media_engine::MediaEngine;
-use webrtc::api::APIBuilder;
+use webrtc::api::{APIBuilder, API};
 use webrtc::interceptor::registry::Registry;
+use webrtc::media::Sample;
 use webrtc::peer_connection::configuration::RTCConfiguration;
 use webrtc::peer_connection::peer_connection_state::RTCPeerConnectionState;
 use webrtc::peer_connection::sdp::session_description::RTCSessionDescription;
 use webrtc::track::track_local::track_local_static_rtp::TrackLocalStaticRTP;
 use webrtc::track::track_local::track_local_static_sample::TrackLocalStaticSample;
-use webrtc::track::track_local::TrackLocal;
+use webrtc::track::track_local::{TrackLocal, TrackLocalWriter};
 
 // Color codes for terminal output
 const GREEN: &str = "\x1b[32m";
@@ -40,15 +46,74 @@ use crate::websink::imp::CAT;
 #[folder = "static/"]
 struct Asset;
 
+// An embedded asset ready to send, content type and body are resolved once
+#[derive(Clone)]
+struct StaticAsset {
+    content_type: HeaderValue,
+    body: Bytes,
+    // Gzip variant for text assets, compressed once so requests only pick a body
+    gzip: Option<Bytes>,
+}
+
+// Compress a text asset at the highest level, keeping the result only if it is smaller
+fn gzip_asset(mime: &mime_guess::Mime, data: &[u8]) -> Option<Bytes> {
+    let compressible = mime.type_() == mime_guess::mime::TEXT
+        || matches!(mime.subtype().as_str(), "javascript" | "json" | "xml")
+        || mime.suffix().is_some_and(|suffix| suffix == mime_guess::mime::XML);
+    if !compressible {
+        return None;
+    }
+    let mut encoder = GzEncoder::new(Vec::new(), Compression::best());
+    encoder.write_all(data).ok()?;
+    let compressed = encoder.finish().ok()?;
+    (compressed.len() < data.len()).then(|| Bytes::from(compressed))
+}
+
+// Whether the client lists gzip in Accept-Encoding without refusing it through q=0
+fn accepts_gzip(headers: &HeaderMap) -> bool {
+    let Some(accept) = headers.get(header::ACCEPT_ENCODING).and_then(|v| v.to_str().ok()) else {
+        return false;
+    };
+    accept.split(',').any(|entry| {
+        let mut parts = entry.split(';').map(str::trim);
+        let coding = parts.next().unwrap_or_default();
+        let refused = parts.any(|param| param.strip_prefix("q=").and_then(|q| q.parse::<f32>().ok()) == Some(0.0));
+        (coding.eq_ignore_ascii_case("gzip") || coding == "*") && !refused
+    })
+}
+
+// All embedded assets keyed by request path, with / serving index.html, built on first
+// request and shared by every response
+static ASSETS: LazyLock<HashMap<String, StaticAsset>> = LazyLock::new(|| {
+    let mut assets: HashMap<String, StaticAsset> = Asset::iter()
+        .filter_map(|path| {
+            let file = Asset::get(&path)?;
+            let mime = mime_guess::from_path(path.as_ref()).first_or_octet_stream();
+            let content_type = HeaderValue::from_str(mime.as_ref()).ok()?;
+            // Embedded data is normally static, so the body can point straight at it
+            let body = match file.data {
+                Cow::Borrowed(data) => Bytes::from_static(data),
+                Cow::Owned(data) => Bytes::from(data),
+            };
+            let gzip = gzip_asset(&mime, &body);
+            Some((format!("/{}", path), StaticAsset { content_type, body, gzip }))
+        })
+        .collect();
+    if let Some(index) = assets.get("/index.html").cloned() {
+        assets.insert("/".to_string(), index);
+    }
+    assets
+});
+
 // Types for WebRTC signaling
 #[derive(Serialize, Deserialize, Debug)]
 pub struct SessionRequest {
-    pub offer: serde_json::Value,
+    pub offer: RTCSessionDescription,
 }
 
 #[derive(Serialize, Deserialize, Debug)]
 pub struct SessionResponse {
-    pub answer: serde_json::Value,
+    pub answer: RTCSessionDescription,
     pub session_id: String,
     pub negotiated_codec: Option<String>,
 }
@@ -75,6 +140,44 @@ impl VideoTrack {
     }
 }
 
+// A buffer handed from render() to the track writer task
+pub struct Frame {
+    pub data: Bytes,
+    pub duration: Duration,
+}
+
+impl VideoTrack {
+    // Write frames to the track in arrival order until every sender is dropped
+    pub async fn write_frames(self, mut rx: mpsc::Receiver<Frame>) {
+        while let Some(frame) = rx.recv().await {
+            match &self {
+                VideoTrack::Sample(track) => {
+                    let sample = Sample { data: frame.data, duration: frame.duration, ..Default::default() };
+                    if let Err(e) = track.write_sample(&sample).await {
+                        gst::error!(CAT, "❌ Failed to write sample: {}", e);
+                    }
+                }
+                VideoTrack::Rtp(track) => {
+                    use util::Unmarshal;
+
+                    // Unmarshalling from Bytes slices the payload out of the buffer instead of copying it
+                    let mut buf = frame.data;
+                    match rtp::packet::Packet::unmarshal(&mut buf) {
+                        Ok(rtp_packet) => {
+                            if let Err(e) = track.write_rtp(&rtp_packet).await {
+                                gst::error!(CAT, "❌ Failed to write RTP packet: {}", e);
+                            }
+                        }
+                        Err(e) => {
+                            gst::error!(CAT, "❌ Failed to parse RTP packet: {}", e);
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+
 // Element state containing HTTP server and WebRTC components
 #[derive(Default)]
 pub struct State {
@@ -85,7 +188,46 @@ pub struct State {
     pub unblock_rx: Option<mpsc::Receiver<i32>>,
     // WebRTC components
     pub video_track: Option<VideoTrack>,
+    // Feeds the writer task of the current video track
+    pub frame_tx: Option<mpsc::Sender<Frame>>,
     pub webrtc_config: Option<RTCConfiguration>,
+    // Built once in start(), every peer connection gets its own copy of the media engine
+    pub webrtc_api: Option<Arc<API>>,
+}
+
+// Build the WebRTC API with the default codecs and interceptors
+pub fn build_webrtc_api() -> Result<API, webrtc::Error> {
+    let mut m = MediaEngine::default();
+    m.register_default_codecs()?;
+
+    let mut registry = Registry::new();
+    registry = register_default_interceptors(registry, &mut m)?;
+
+    Ok(APIBuilder::new().with_media_engine(m).with_interceptor_registry(registry).build())
+}
+
+// Peer connection that is not in the session map yet. Dropping it before register()
+// closes the connection, the way the deferred close does in websink.go.
+struct UnregisteredPeer(Option<Arc<webrtc::peer_connection::RTCPeerConnection>>);
+
+impl UnregisteredPeer {
+    fn register(mut self) -> Arc<webrtc::peer_connection::RTCPeerConnection> {
+        self.0.take().expect("peer connection registered twice")
+    }
+}
+
+impl Drop for UnregisteredPeer {
+    fn drop(&mut self) {
+        // close() is async, so it runs on a task of the runtime that handled the request
+        if let (Some(pc), Ok(handle)) = (self.0.take(), tokio::runtime::Handle::try_current()) {
+            gst::debug!(CAT, "🧹 Closing peer connection that never completed setup");
+            handle.spawn(async move {
+                if let Err(e) = pc.close().await {
+                    gst::warning!(CAT, "⚠️ Failed to close peer connection: {}", e);
+                }
+            });
+        }
+    }
 }
 
 // Handle WebRTC session request (create peer connection and answer)
@@ -93,47 +235,41 @@ pub async fn handle_session_request(
     req: SessionRequest,
     state: Arc<Mutex<State>>,
 ) -> Result<SessionResponse, Box<dyn std::error::Error + Send + Sync>> {
-    gst::info!(CAT, "🎯 Processing WebRTC session request");
+    gst::debug!(CAT, "🎯 Processing WebRTC session request");
 
     // Get the shared video track and config from state
-    let (webrtc_config, video_track) = {
+    let (webrtc_config, video_track, api) = {
         let state_guard = state.lock().unwrap();
         let config = state_guard.webrtc_config.clone().ok_or("WebRTC config not initialized")?;
         let track = state_guard.video_track.clone().ok_or("Video track not initialized")?;
-        (config, track)
+        let api = state_guard.webrtc_api.clone().ok_or("WebRTC API not initialized")?;
+        (config, track, api)
     };
 
     // Detect what codec we're actually sending
     let actual_codec = video_track.codec_mime_type().to_lowercase();
-    gst::info!(CAT, "🎥 Sending {} codec to client", actual_codec.to_uppercase());
+    gst::debug!(CAT, "🎥 Sending {} codec to client", actual_codec.to_uppercase());
 
-    // Create a new MediaEngine and API for this session
-    let mut m = MediaEngine::default();
-    m.register_default_codecs()?;
-
-    let mut registry = Registry::new();
-    registry = register_default_interceptors(registry, &mut m)?;
-
-    let api = APIBuilder::new().with_media_engine(m).with_interceptor_registry(registry).build();
-
-    // Create a new peer connection using the API and shared config
+    // Create a new peer connection using the shared API and config
     let peer_connection = Arc::new(api.new_peer_connection(webrtc_config).await?);
-    gst::info!(CAT, "📞 Created new peer connection");
+    gst::debug!(CAT, "📞 Created new peer connection");
 
-    let _rtp_sender = peer_connection.add_track(video_track.as_track_local()).await?;
-    gst::info!(CAT, "🎥 Added video track to peer connection");
+    // Close the connection on every early return from here on, and if the request is dropped
+    let unregistered = UnregisteredPeer(Some(Arc::clone(&peer_connection)));
 
-    // Parse the offer from the request
-    let offer: RTCSessionDescription = serde_json::from_value(req.offer)?;
-    gst::info!(CAT, "📨 Parsed offer from client");
+    let _rtp_sender = peer_connection.add_track(video_track.as_track_local()).await?;
+    gst::debug!(CAT, "🎥 Added video track to peer connection");
 
-    // Set remote description
-    peer_connection.set_remote_description(offer).await?;
-    gst::info!(CAT, "🔗 Set remote description");
+    // Set remote description, the offer was already parsed while extracting the request body
+    peer_connection.set_remote_description(req.offer).await?;
+    gst::debug!(CAT, "🔗 Set remote description");
 
     // Create answer
     let answer = peer_connection.create_answer(None).await?;
-    gst::info!(CAT, "📤 Created answer");
+    gst::debug!(CAT, "📤 Created answer");
+
+    // Create the gathering promise before gathering can start, so its completion is never missed
+    let mut gather_complete = peer_connection.gathering_complete_promise().await;
 
     // Set local description
     peer_connection.set_local_description(answer).await.map_err(|e| {
@@ -149,12 +285,11 @@ pub async fn handle_session_request(
             Box::<dyn std::error::Error + Send + Sync>::from(e)
         }
     })?;
-    gst::info!(CAT, "🏠 Set local description");
+    gst::debug!(CAT, "🏠 Set local description");
 
     // Wait for ICE gathering to complete
-    let mut gather_complete = peer_connection.gathering_complete_promise().await;
     let _ = gather_complete.recv().await;
-    gst::info!(CAT, "🧊 ICE gathering completed");
+    gst::debug!(CAT, "🧊 ICE gathering completed");
 
     // Get the final answer with ICE candidates
     let final_answer = peer_connection.local_description().await.ok_or("Failed to get local description")?;
@@ -163,17 +298,17 @@ pub async fn handle_session_request(
     let session_id = Uuid::new_v4().to_string();
 
     // Store the peer connection in the state and update peer count
-    {
+    let count = {
         let mut state_guard = state.lock().unwrap();
-        state_guard.peer_connections.insert(session_id.clone(), Arc::clone(&peer_connection));
+        state_guard.peer_connections.insert(session_id.clone(), unregistered.register());
 
         // Update peer count and send notification
         let count = state_guard.peer_connections.len() as i32;
         if let Some(tx) = &state_guard.unblock_tx {
             let _ = tx.try_send(count);
         }
-        gst::info!(CAT, "👥 Added new peer connection, total count: {}", count);
-    }
+        count
+    };
 
     // Handle peer disconnection
     let state_clone = Arc::clone(&state);
@@ -182,14 +317,50 @@ pub async fn handle_session_request(
         gst::debug!(CAT, "🔄 Peer connection state changed to: {:?} for session {}", s, session_id_clone);
         let mut state_guard = state_clone.lock().unwrap();
         match s {
-            RTCPeerConnectionState::Disconnected | RTCPeerConnectionState::Failed | RTCPeerConnectionState::Closed => {
-                gst::info!(CAT, "🔌 Peer disconnected, removing session: {}", session_id_clone);
-                state_guard.peer_connections.remove(&session_id_clone);
+            RTCPeerConnectionState::Disconnected => {
+                // Usually a network or ICE consent blip, the peer gets DISCONNECT_GRACE to
+                // recover before it is closed. The timer holds a Weak, so it never keeps a
+                // connection alive that was already closed and dropped.
+                if let Some(pc) = state_guard.peer_connections.get(&session_id_clone).map(Arc::downgrade) {
+                    let session_id = session_id_clone.clone();
+                    tokio::spawn(async move {
+                        tokio::time::sleep(DISCONNECT_GRACE).await;
+                        let Some(pc) = pc.upgrade() else { return };
+                        if pc.connection_state() == RTCPeerConnectionState::Disconnected {
+                            gst::info!(CAT, "🔌 Peer did not reconnect, closing session: {}", session_id);
+                            if let Err(e) = pc.close().await {
+                                gst::warning!(CAT, "⚠️ Failed to close peer connection {}: {}", session_id, e);
+                            }
+                        }
+                    });
+                }
+            }
+            RTCPeerConnectionState::Failed | RTCPeerConnectionState::Closed => {
+                let removed = state_guard.peer_connections.remove(&session_id_clone);
                 // Update peer count and send notification
                 if let Some(tx) = &state_guard.unblock_tx {
                     let _ = tx.try_send(state_guard.peer_connections.len() as i32);
                 }
-                gst::info!(CAT, "📊 Updated peer count to: {}", state_guard.peer_connections.len() as i32);
+
+                if let Some(pc) = removed {
+                    gst::info!(
+                        CAT,
+                        "🔌 Peer disconnected, removed session: {}, total count: {}",
+                        session_id_clone,
+                        state_guard.peer_connections.len()
+                    );
+                    // A failed connection still holds its transports and ICE agent, so close it.
+                    // webrtc-rs runs this handler under a lock that close() takes again, so the
+                    // close runs on its own task, its Closed event then finds the session gone.
+                    if s == RTCPeerConnectionState::Failed {
+                        let session_id = session_id_clone.clone();
+                        tokio::spawn(async move {
+                            if let Err(e) = pc.close().await {
+                                gst::warning!(CAT, "⚠️ Failed to close peer connection {}: {}", session_id, e);
+                            }
+                        });
+                    }
+                }
             }
             RTCPeerConnectionState::Connected => {
                 gst::debug!(CAT, "🕼 Peer connected successfully: {}, num peers: {}", session_id_clone, state_guard.peer_connections.len());
@@ -202,47 +373,52 @@ pub async fn handle_session_request(
         Box::pin(async {})
     }));
 
-    // Serialize answer to JSON
-    let answer_json = serde_json::to_value(&final_answer)?;
+    // The answer is serialized once, straight into the response body
+    let response = SessionResponse { answer: final_answer, session_id: session_id.clone(), negotiated_codec: Some(actual_codec.clone()) };
 
-    let response = SessionResponse { answer: answer_json, session_id: session_id.clone(), negotiated_codec: Some(actual_codec.clone()) };
-
-    gst::info!(CAT, "✅ WebRTC session established with ID: {} using codec: {}", session_id, actual_codec);
+    // One info record per session, the individual setup steps above are logged at debug
+    gst::info!(CAT, "✅ WebRTC session established with ID: {} using codec: {}, total count: {}", session_id, actual_codec, count);
     Ok(response)
 }
 
-fn next_free_port(mut port: u16) -> u16 {
-    loop {
-        if TcpListener::bind(("127.0.0.1", port)).is_ok() {
-            return port;
-        }
-        port += 1;
-    }
-}
-
 async fn handle_session(
     AxumState(state): AxumState<Arc<Mutex<State>>>,
     Json(req): Json<SessionRequest>,
 ) -> Result<Json<SessionResponse>, AppError> {
-    gst::info!(CAT, "Received WebRTC session request");
+    gst::debug!(CAT, "Received WebRTC session request");
+    // Turn viewers away before any WebRTC resources are spent on them
+    let num_peers = state.lock().unwrap().peer_connections.len();
+    if num_peers >= MAX_PEERS {
+        return Err(AppError(StatusCode::SERVICE_UNAVAILABLE, format!("Too many viewers ({}), try again later", num_peers).into()));
+    }
     let response = handle_session_request(req, state).await?;
-    gst::info!(CAT, "Successfully handled WebRTC session request");
+    gst::debug!(CAT, "Successfully handled WebRTC session request");
     Ok(Json(response))
 }
 
-async fn serve_static(uri: axum::http::Uri) -> impl IntoResponse {
-    let path = uri.path().trim_start_matches('/');
-    let path_to_serve = if path.is_empty() { "index.html" } else { path };
+async fn serve_static(uri: axum::http::Uri, headers: HeaderMap) -> impl IntoResponse {
+    let path_to_serve = uri.path();
 
     gst::debug!(CAT, "Static asset request for: {}", path_to_serve);
 
-    match Asset::get(path_to_serve) {
-        Some(content) => {
-            let mime = mime_guess::from_path(path_to_serve).first_or_octet_stream();
-            let data: &[u8] = &content.data;
-            gst::debug!(CAT, "Serving static asset: {} ({} bytes, mime: {})", path_to_serve, data.len(), mime.as_ref());
+    match ASSETS.get(path_to_serve) {
+        Some(asset) => {
+            let mut response = Response::builder().header(header::CONTENT_TYPE, asset.content_type.clone());
+            let body = match &asset.gzip {
+                Some(gzip) => {
+                    response = response.header(header::VARY, "Accept-Encoding");
+                    if accepts_gzip(&headers) {
+                        response = response.header(header::CONTENT_ENCODING, "gzip");
+                        gzip
+                    } else {
+                        &asset.body
+                    }
+                }
+                None => &asset.body,
+            };
+            gst::debug!(CAT, "Serving static asset: {} ({} bytes, mime: {:?})", path_to_serve, body.len(), asset.content_type);
 
-            Response::builder().header("Content-Type", mime.as_ref()).body(axum::body::Body::from(data.to_vec())).unwrap()
+            response.body(axum::body::Body::from(body.clone())).unwrap()
         }
         None => {
             gst::warning!(CAT, "Static asset not found: {}", path_to_serve);
@@ -251,12 +427,16 @@ async fn serve_static(uri: axum::http::Uri) -> impl IntoResponse {
     }
 }
 
-struct AppError(Box<dyn std::error::Error + Send + Sync>);
+struct AppError(StatusCode, Box<dyn std::error::Error + Send + Sync>);
 
 impl IntoResponse for AppError {
     fn into_response(self) -> Response {
-        gst::error!(CAT, "Failed to handle WebRTC session request: {}", self.0);
-        (StatusCode::INTERNAL_SERVER_ERROR, self.0.to_string()).into_response()
+        if self.0 == StatusCode::SERVICE_UNAVAILABLE {
+            gst::warning!(CAT, "Rejected WebRTC session request: {}", self.1);
+        } else {
+            gst::error!(CAT, "Failed to handle WebRTC session request: {}", self.1);
+        }
+        (self.0, self.1.to_string()).into_response()
     }
 }
 
@@ -265,18 +445,62 @@ where
     E: Into<Box<dyn std::error::Error + Send + Sync>>,
 {
     fn from(err: E) -> Self {
-        Self(err.into())
+        Self(StatusCode::INTERNAL_SERVER_ERROR, err.into())
+    }
+}
+
+// Most viewers served at once, further session requests get 503 instead of a peer connection
+const MAX_PEERS: usize = 256;
+
+// How long a disconnected peer may take to recover before its connection is closed
+const DISCONNECT_GRACE: Duration = Duration::from_secs(10);
+
+// Largest accepted session request, roomy for SDP with many media sections
+const MAX_SESSION_REQUEST_BYTES: usize = 4 * 1024 * 1024;
+
+// Requests handled at once across all routes, further requests wait their turn instead of piling up tasks
+const MAX_CONCURRENT_REQUESTS: usize = 16;
+
+// Listen backlog, large enough that several viewers opening the page at once are not refused
+const LISTEN_BACKLOG: u32 = 1024;
+
+// How many ports above the requested one are tried before giving up, as in the Go element
+const PORT_SEARCH_RANGE: u16 = 100;
+
+// Bind the first free port from requested_port upwards, the bind itself is the availability check
+fn bind_free_port(requested_port: u16) -> std::io::Result<tokio::net::TcpListener> {
+    let last_port = requested_port.saturating_add(PORT_SEARCH_RANGE - 1);
+    let mut port = requested_port;
+    loop {
+        match bind_listener(std::net::SocketAddr::from((std::net::Ipv6Addr::UNSPECIFIED, port))) {
+            Err(e) if e.kind() == std::io::ErrorKind::AddrInUse && port != 0 && port < last_port => port += 1,
+            result => return result,
+        }
     }
 }
 
+fn bind_listener(addr: std::net::SocketAddr) -> std::io::Result<tokio::net::TcpListener> {
+    let socket = tokio::net::TcpSocket::new_v6()?;
+    // Allow rebinding right after a restart while old connections sit in TIME_WAIT
+    socket.set_reuseaddr(true)?;
+    socket.bind(addr)?;
+    socket.listen(LISTEN_BACKLOG)
+}
+
 pub fn start_http_server(
     state: Arc<Mutex<State>>,
     requested_port: u16,
     rt: &Runtime,
 ) -> Result<(tokio::task::JoinHandle<()>, u16), Box<dyn std::error::Error + Send + Sync>> {
-    // Find an available port
-    let port = next_free_port(requested_port);
-    gst::info!(CAT, "🔍 Found available port: {} (requested: {})", port, requested_port);
+    // Bind before returning, so the server accepts connections as soon as start() succeeds
+    // and a bind failure fails the state change instead of only being logged
+    let listener = {
+        let _guard = rt.enter();
+        bind_free_port(requested_port).map_err(|e| format!("Failed to bind a port from {}: {}", requested_port, e))?
+    };
+    let addr = listener.local_addr()?;
+    let port = addr.port();
+    gst::info!(CAT, "🔍 Bound available port: {} (requested: {})", port, requested_port);
 
     // Print all relevant addresses as in Go version
     let hostname = get_hostname().ok().and_then(|h| h.into_string().ok()).unwrap_or_else(|| "localhost".to_string());
@@ -303,21 +527,15 @@ pub fn start_http_server(
         reset = RESET
     );
 
-    let app = Router::new().route("/api/session", post(handle_session)).fallback(get(serve_static)).with_state(state);
-
-    let addr = format!("[::]:{}", port);
+    let app = Router::new()
+        .route("/api/session", post(handle_session).layer(DefaultBodyLimit::max(MAX_SESSION_REQUEST_BYTES)))
+        .fallback(get(serve_static))
+        .layer(GlobalConcurrencyLimitLayer::new(MAX_CONCURRENT_REQUESTS))
+        .with_state(state);
 
     let handle = rt.spawn(async move {
-        let listener = match tokio::net::TcpListener::bind(&addr).await {
-            Ok(l) => l,
-            Err(e) => {
-                gst::error!(CAT, "Failed to bind to {}: {}", addr, e);
-                return;
-            }
-        };
-
         gst::info!(CAT, "Starting HTTP server on {}", addr);
-        if let Err(e) = axum::serve(listener, app).await {
+        if let Err(e) = axum::serve(listener, app).tcp_nodelay(true).await {
             gst::error!(CAT, "HTTP server error: {}", e);
         }
         gst::info!(CAT, "HTTP server stopped");